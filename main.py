@@ -2,15 +2,24 @@
 from __future__ import annotations
 
 import argparse
+import errno
+import hashlib
+import json
 import logging
+import mmap
+import multiprocessing
 import os
+import re
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
-from dataclasses import dataclass
+import uuid
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Iterable, Optional, Tuple
+from types import MappingProxyType
+from typing import Iterable, Iterator, NamedTuple, Optional, Tuple
 
 # Optional dependency for fallback
 try:
@@ -18,18 +27,47 @@ try:
 except Exception:
     pikepdf = None  # noqa: N816
 
+# Optional dependency for fast change detection (hashlib.blake2b otherwise)
+try:
+    import blake3  # type: ignore
+except Exception:
+    blake3 = None
 
-QUALITY_MAP = {
+
+# Read-only: --quality is resolved to its -dPDFSETTINGS value once, in main()
+QUALITY_MAP = MappingProxyType({
     "screen": "/screen",
     "ebook": "/ebook",
     "printer": "/printer",
     "prepress": "/prepress",
-}
+})
 
 LOG = logging.getLogger("pdfcompress")
 
+# In folder mode, flush result lines to stdout every N files rather than per file
+PRINT_FLUSH_EVERY = 16
+
+# --skip-optimized heuristics (see likely_compressible)
+MIN_BYTES_PER_PAGE = 20_000
+PRECHECK_TAIL_BYTES = 64 * 1024
+_GS_PRODUCER_RE = re.compile(rb"/Producer\s*\([^)]*Ghostscript")
+_PAGE_RE = re.compile(rb"/Type\s*/Page(?![A-Za-z])")
+
+# Sidecar file in --out recording which inputs were already compressed
+MANIFEST_NAME = ".pdfcompress.json"
+
+# fcntl command from <sys/fcntl.h>; not exported by Python's fcntl module
+_F_RDADVISE = 44
+
+QUALITY_CHOICES = tuple(QUALITY_MAP)
+
+# Resolved once per run in main() (and in each Pool worker via _init_worker)
+GS_PATH: Optional[str] = None
+QPDF_PATH: Optional[str] = None
 
-@dataclass
+
+# slots: no per-instance __dict__, cheaper to pickle back from Pool workers
+@dataclass(slots=True, frozen=True)
 class CompressResult:
     src: Path
     dst: Path
@@ -40,26 +78,76 @@ class CompressResult:
     saved_pct: float
     skipped: bool
     message: str
+    digest: Optional[str] = None
+
+
+# Field order matches compress_one's parameters, so workers can call compress_one(*task, ...)
+class CompressTask(NamedTuple):
+    src: Path
+    dst: Path
+    before: int
+    pdfsettings: str
+    overwrite: bool
+    dry_run: bool
+    scratch_dir: Path
+    recompress_flate: bool
+    gs_threads: int
+    known_digest: Optional[str]
+    skip_optimized: bool
+
+
+_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 
 def human_bytes(n: int) -> str:
-    # Simple human-readable bytes formatter
-    units = ["B", "KB", "MB", "GB", "TB"]
-    size = float(n)
-    for u in units:
-        if size < 1024 or u == units[-1]:
-            return f"{size:.2f} {u}" if u != "B" else f"{int(size)} {u}"
-        size /= 1024
-    return f"{n} B"
+    # Simple human-readable bytes formatter; unit index is log1024(n) via bit_length
+    if n < 1024:
+        return f"{n} B"
+    i = min((n.bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{n / (1 << (i * 10)):.2f} {_UNITS[i]}"
+
+
+def prefetch_file(path: Path) -> None:
+    """
+    Best-effort hint to the OS to start reading `path` into the page cache,
+    so Ghostscript's reads hit memory when it gets to this file.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        if hasattr(os, "posix_fadvise"):
+            # len=0 means "to end of file"
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        elif sys.platform == "darwin":
+            import fcntl
+
+            # struct radvisory { off_t ra_offset; int ra_count; }
+            size = min(os.fstat(fd).st_size, 2**31 - 1)
+            fcntl.fcntl(fd, _F_RDADVISE, struct.pack("qi", 0, size))
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 def find_pdfs_in_folder(folder: Path, recursive: bool) -> Iterable[Path]:
+    """
+    Single pass over the tree, matching the .pdf suffix case-insensitively.
+    (Globbing *.pdf and *.PDF separately walks twice and yields duplicates
+    on case-insensitive filesystems.)
+    """
     if recursive:
-        yield from folder.rglob("*.pdf")
-        yield from folder.rglob("*.PDF")
+        walk = os.walk(folder)
     else:
-        yield from folder.glob("*.pdf")
-        yield from folder.glob("*.PDF")
+        with os.scandir(folder) as it:
+            walk = [(str(folder), [], [e.name for e in it if e.is_file()])]
+
+    for root, _, files in walk:
+        for name in files:
+            if name.lower().endswith(".pdf"):
+                yield Path(root) / name
 
 
 def ensure_output_path(
@@ -81,20 +169,37 @@ def ensure_output_path(
     return out_dir / rel
 
 
-def run_ghostscript_compress(src: Path, tmp_out: Path, quality: str) -> Tuple[bool, str]:
-    gs = shutil.which("gs")
-    if not gs:
-        return False, "Ghostscript (gs) not found."
+def default_gs_threads(jobs: int) -> int:
+    # Split the cores between parallel workers so total GS threads ~= cores
+    return max(1, (os.cpu_count() or 1) // jobs)
+
+
+def _decode_output(data: Optional[bytes]) -> str:
+    # Captured as bytes; only decoded when actually reported
+    return data.decode("utf-8", "replace").strip() if data else ""
+
 
-    pdfsettings = QUALITY_MAP.get(quality)
-    if not pdfsettings:
-        return False, f"Unknown quality: {quality}"
+def run_ghostscript_compress(
+    src: Path,
+    tmp_out: Path,
+    pdfsettings: str,
+    gs_path: Optional[str],
+    gs_threads: int,
+) -> Tuple[bool, str, int]:
+    """
+    Returns (ok, message, bytes_written). Ghostscript streams the PDF to stdout,
+    which is attached directly to tmp_out, so the output size is known without
+    a second stat.
+    """
+    if not gs_path:
+        return False, "Ghostscript (gs) not found.", 0
 
     # Ghostscript command that often yields good compression
     cmd = [
-        gs,
+        gs_path,
         "-sDEVICE=pdfwrite",
         "-dCompatibilityLevel=1.4",
+        "-q",
         "-dNOPAUSE",
         "-dBATCH",
         "-dSAFER",
@@ -102,43 +207,98 @@ def run_ghostscript_compress(src: Path, tmp_out: Path, quality: str) -> Tuple[bo
         "-dDetectDuplicateImages=true",
         "-dCompressFonts=true",
         "-dSubsetFonts=true",
-        f"-sOutputFile={str(tmp_out)}",
+        # Threaded image rendering/recompression, and keep image bands in RAM
+        f"-dNumRenderingThreads={gs_threads}",
+        "-dBufferSpace=1073741824",
+        "-dMaxBitmap=1073741824",
+        "-sstdout=%stderr",  # keep PostScript messages out of the PDF stream
+        "-sOutputFile=-",
         str(src),
     ]
 
+    try:
+        with open(tmp_out, "wb") as fout:
+            proc = subprocess.run(
+                cmd,
+                stdout=fout,
+                stderr=subprocess.PIPE,
+                check=False,
+            )
+            written = fout.tell()
+        if proc.returncode != 0:
+            msg = _decode_output(proc.stderr) or "Ghostscript failed."
+            return False, msg, 0
+        if proc.stderr and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("gs: %s", _decode_output(proc.stderr))
+        if written == 0:
+            return False, "Ghostscript produced no output.", 0
+        return True, "Compressed with Ghostscript.", written
+    except Exception as e:
+        return False, f"Ghostscript execution error: {e}", 0
+
+
+def run_qpdf_optimize(
+    src: Path,
+    tmp_out: Path,
+    qpdf_path: Optional[str],
+    recompress_flate: bool = False,
+) -> Tuple[bool, str]:
+    """
+    First fallback: the native qpdf binary (same library as pikepdf, without
+    Python in the per-object loop). Like pikepdf, it restructures the file
+    rather than downsampling images.
+    """
+    if not qpdf_path:
+        return False, "qpdf not found."
+
+    cmd = [
+        qpdf_path,
+        "--object-streams=generate",
+        "--compress-streams=y",
+    ]
+    if recompress_flate:
+        cmd += ["--recompress-flate", "--compression-level=9"]
+    cmd += [str(src), str(tmp_out)]
+
     try:
         proc = subprocess.run(
             cmd,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
-            text=True,
             check=False,
         )
-        if proc.returncode != 0:
-            msg = proc.stderr.strip() or proc.stdout.strip() or "Ghostscript failed."
-            return False, msg
-        return True, "Compressed with Ghostscript."
+        # Exit code 3: succeeded with warnings (output was written)
+        if proc.returncode not in (0, 3):
+            return False, _decode_output(proc.stderr) or "qpdf failed."
+        return True, "Optimized with qpdf (structure/streams)."
     except Exception as e:
-        return False, f"Ghostscript execution error: {e}"
+        return False, f"qpdf execution error: {e}"
 
 
-def run_pikepdf_optimize(src: Path, tmp_out: Path) -> Tuple[bool, str]:
+def run_pikepdf_optimize(src: Path, tmp_out: Path, recompress_flate: bool = False) -> Tuple[bool, str]:
     """
     Offline fallback:
+    - used when qpdf is not installed (or fails)
     - pikepdf can rewrite/optimize structure and sometimes reduce size modestly
     - It usually won't aggressively downsample images (that’s why GS is preferred)
+    - recompress_flate re-deflates existing streams at level 9 (more CPU, smaller output)
     """
     if pikepdf is None:
         return False, "pikepdf is not installed (fallback unavailable)."
 
     try:
-        with pikepdf.open(str(src)) as pdf:
+        if recompress_flate:
+            pikepdf.settings.set_flate_compression_level(9)
+        # mmap instead of reading the whole file into memory
+        with pikepdf.open(str(src), access_mode=pikepdf.AccessMode.mmap) as pdf:
             # Basic optimizations: remove unused objects, compress streams where possible
             pdf.remove_unreferenced_resources()
             pdf.save(
                 str(tmp_out),
-                optimize_streams=True,
                 compress_streams=True,
+                # Pack objects into object streams (smaller xref, fewer objects written)
+                object_stream_mode=pikepdf.ObjectStreamMode.generate,
+                recompress_flate=recompress_flate,
                 linearize=False,
             )
         return True, "Optimized with pikepdf (structure/streams)."
@@ -151,28 +311,169 @@ def safe_write_output(
     final_out: Path,
     overwrite: bool,
 ) -> Tuple[bool, str]:
-    final_out.parent.mkdir(parents=True, exist_ok=True)
-
+    # final_out.parent is created up front by main(), once per directory
     if final_out.exists() and not overwrite:
         return False, f"Output exists (use --overwrite): {final_out}"
 
     try:
-        shutil.move(str(tmp_out), str(final_out))
+        try:
+            # Atomic rename, no data copy (scratch dir is on the output filesystem)
+            os.replace(tmp_out, final_out)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(tmp_out), str(final_out))
         return True, "Saved."
     except Exception as e:
         return False, f"Failed to save output: {e}"
 
 
+def file_digest(path: Path) -> str:
+    """
+    Content hash of `path`, prefixed with the algorithm so digests from
+    different hashers never compare equal.
+    """
+    if blake3 is not None:
+        h, algo = blake3.blake3(), "blake3"
+    else:
+        h, algo = hashlib.blake2b(), "blake2b"
+    with open(path, "rb", buffering=0) as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return f"{algo}:{h.hexdigest()}"
+
+
+def unchanged_result(src: Path, dst: Path, before: int, digest: str) -> CompressResult:
+    return CompressResult(
+        src=src,
+        dst=dst,
+        method="unchanged",
+        before_bytes=before,
+        after_bytes=before,
+        saved_bytes=0,
+        saved_pct=0.0,
+        skipped=True,
+        message="Unchanged since last run; existing output kept.",
+        digest=digest,
+    )
+
+
+def unreadable_result(src: Path, dst: Path, before: int, err: OSError) -> CompressResult:
+    return CompressResult(
+        src=src,
+        dst=dst,
+        method="failed",
+        before_bytes=before,
+        after_bytes=before,
+        saved_bytes=0,
+        saved_pct=0.0,
+        skipped=True,
+        message=f"Cannot read input: {err}",
+    )
+
+
+def likely_compressible(path: Path, size: int) -> Tuple[bool, str]:
+    """
+    Cheap pre-check (no Ghostscript) for inputs that are unlikely to shrink:
+    - already written by Ghostscript (/Producer in the trailing Info dict)
+    - already small per page (under MIN_BYTES_PER_PAGE)
+    Returns (compressible, reason). Anything it cannot judge counts as compressible.
+    """
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if _GS_PRODUCER_RE.search(mm, max(0, len(mm) - PRECHECK_TAIL_BYTES)):
+                return False, "Skipped: already produced by Ghostscript."
+            # Page dicts inside compressed object streams aren't visible; then pages == 0
+            pages = sum(1 for _ in _PAGE_RE.finditer(mm))
+    except (OSError, ValueError):
+        return True, ""
+
+    if pages and size / pages < MIN_BYTES_PER_PAGE:
+        return False, f"Skipped: already compact ({human_bytes(size // pages)}/page)."
+    return True, ""
+
+
+def precheck_result(
+    src: Path,
+    dst: Path,
+    before: int,
+    reason: str,
+    digest: Optional[str] = None,
+) -> CompressResult:
+    return CompressResult(
+        src=src,
+        dst=dst,
+        method="precheck",
+        before_bytes=before,
+        after_bytes=before,
+        saved_bytes=0,
+        saved_pct=0.0,
+        skipped=True,
+        message=reason,
+        digest=digest,
+    )
+
+
+def load_manifest(out_dir: Path) -> dict[str, dict]:
+    path = out_dir / MANIFEST_NAME
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        LOG.warning("Ignoring unreadable manifest %s: %s", path, e)
+        return {}
+
+
+def save_manifest(out_dir: Path, manifest: dict[str, dict]) -> None:
+    path = out_dir / MANIFEST_NAME
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp, path)
+    except Exception as e:
+        tmp.unlink(missing_ok=True)
+        LOG.warning("Failed to save manifest %s: %s", path, e)
+
+
+def manifest_digest(manifest: dict[str, dict], src: Path, settings: dict) -> Optional[str]:
+    """
+    Digest recorded for `src`, but only if that output was produced with the
+    same settings (--quality, --recompress-flate) and the same tools on hand.
+    E.g. outputs made without gs are redone once gs is installed.
+    """
+    entry = manifest.get(str(src))
+    if not isinstance(entry, dict):
+        return None
+    if any(entry.get(k) != v for k, v in settings.items()):
+        return None
+    return entry.get("digest")
+
+
+def record_result(manifest: dict[str, dict], res: CompressResult, settings: dict) -> None:
+    if not res.skipped and res.digest:
+        manifest[str(res.src)] = {"digest": res.digest, **settings}
+
+
 def compress_one(
     src: Path,
     dst: Path,
-    quality: str,
+    before: int,
+    pdfsettings: str,
     overwrite: bool,
     dry_run: bool,
+    scratch_dir: Path,
+    recompress_flate: bool,
+    gs_threads: int,
+    known_digest: Optional[str],
+    skip_optimized: bool,
+    gs_path: Optional[str],
+    qpdf_path: Optional[str],
 ) -> CompressResult:
-    before = src.stat().st_size
-    method = "none"
-
+    # `before` is the size main() took when it found the file (one stat per input)
     if dry_run:
         return CompressResult(
             src=src,
@@ -186,21 +487,94 @@ def compress_one(
             message="Dry run: no file written.",
         )
 
-    with tempfile.TemporaryDirectory(prefix="pdfcompress_") as td:
-        tmp_out = Path(td) / (src.stem + ".compressed.pdf")
+    # Hash only to compare with a manifest entry or to record a file that is about
+    # to be compressed; inputs the pre-check rejects are otherwise never hashed.
+    digest: Optional[str] = None
+    if known_digest is not None:
+        try:
+            digest = file_digest(src)
+        except OSError as e:
+            return unreadable_result(src, dst, before, e)
+        if digest == known_digest and dst.exists():
+            return unchanged_result(src, dst, before, digest)
+    if skip_optimized:
+        compressible, reason = likely_compressible(src, before)
+        if not compressible:
+            return precheck_result(src, dst, before, reason, digest)
+    if digest is None:
+        try:
+            digest = file_digest(src)
+        except OSError as e:
+            return unreadable_result(src, dst, before, e)
+
+    res = _compress_file(
+        src,
+        dst,
+        before,
+        pdfsettings,
+        overwrite,
+        scratch_dir,
+        recompress_flate,
+        gs_threads,
+        gs_path,
+        qpdf_path,
+    )
+    return replace(res, digest=digest)
+
 
+def _compress_file(
+    src: Path,
+    dst: Path,
+    before: int,
+    pdfsettings: str,
+    overwrite: bool,
+    scratch_dir: Path,
+    recompress_flate: bool,
+    gs_threads: int,
+    gs_path: Optional[str],
+    qpdf_path: Optional[str],
+) -> CompressResult:
+    method = "none"
+
+    # Unique name so parallel workers can share one scratch dir
+    tmp_out = scratch_dir / f"{src.stem}.{os.getpid()}.{uuid.uuid4().hex}.pdf"
+    try:
         # Prefer Ghostscript if available
-        ok, msg = run_ghostscript_compress(src, tmp_out, quality)
+        ok, msg, after = run_ghostscript_compress(src, tmp_out, pdfsettings, gs_path, gs_threads)
         if ok:
-            method = f"ghostscript({quality})"
+            method = f"ghostscript({pdfsettings.lstrip('/')})"
         else:
             LOG.warning("Ghostscript unavailable/failed for %s: %s", src.name, msg)
-            # Fallback: pikepdf optimize
-            ok2, msg2 = run_pikepdf_optimize(src, tmp_out)
+            # Drop any partial GS output so the existence check below is meaningful
+            tmp_out.unlink(missing_ok=True)
+            # Fallback: native qpdf, then pikepdf as a last resort
+            ok2, msg2 = run_qpdf_optimize(src, tmp_out, qpdf_path, recompress_flate)
             if ok2:
-                method = "pikepdf(optimize)"
+                method = "qpdf(optimize)"
                 msg = msg2
             else:
+                tmp_out.unlink(missing_ok=True)
+                ok3, msg3 = run_pikepdf_optimize(src, tmp_out, recompress_flate)
+                if ok3:
+                    method = "pikepdf(optimize)"
+                    msg = msg3
+                else:
+                    return CompressResult(
+                        src=src,
+                        dst=dst,
+                        method="failed",
+                        before_bytes=before,
+                        after_bytes=before,
+                        saved_bytes=0,
+                        saved_pct=0.0,
+                        skipped=True,
+                        message=f"Compression failed. GS: {msg} | qpdf: {msg2} | pikepdf: {msg3}",
+                    )
+
+            # One stat both detects a missing output and yields its size
+            try:
+                after = os.stat(tmp_out).st_size
+            except FileNotFoundError:
                 return CompressResult(
                     src=src,
                     dst=dst,
@@ -210,24 +584,9 @@ def compress_one(
                     saved_bytes=0,
                     saved_pct=0.0,
                     skipped=True,
-                    message=f"Compression failed. GS: {msg} | Fallback: {msg2}",
+                    message="Compression produced no output file.",
                 )
 
-        if not tmp_out.exists():
-            return CompressResult(
-                src=src,
-                dst=dst,
-                method="failed",
-                before_bytes=before,
-                after_bytes=before,
-                saved_bytes=0,
-                saved_pct=0.0,
-                skipped=True,
-                message="Compression produced no output file.",
-            )
-
-        after = tmp_out.stat().st_size
-
         # Skip if not smaller
         if after >= before:
             return CompressResult(
@@ -270,6 +629,65 @@ def compress_one(
             skipped=False,
             message=msg,
         )
+    finally:
+        # Leftovers from failed/skipped runs would otherwise pile up in the shared dir
+        tmp_out.unlink(missing_ok=True)
+
+
+def order_tasks(tasks: list[CompressTask], jobs: int) -> list[CompressTask]:
+    """
+    With several workers, dispatch the largest files first: the Pool hands out
+    work as workers free up, so starting the long jobs early keeps one big file
+    from running alone at the end of the batch.
+    """
+    if jobs <= 1:
+        return tasks
+    return sorted(tasks, key=lambda task: task.before, reverse=True)
+
+
+def _compress_star(task: CompressTask) -> CompressResult:
+    # Pool.imap_unordered passes a single argument; unpack it for compress_one
+    return compress_one(*task, GS_PATH, QPDF_PATH)
+
+
+def pin_worker(cpus_per_worker: int) -> None:
+    """
+    Pin the current Pool worker (and the gs processes it starts, which inherit
+    the mask) to its own slice of CPUs, so Ghostscript's working set stays in
+    that core's caches. Linux only; a no-op elsewhere.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        # Pool workers are named "...PoolWorker-<n>", n counting from 1
+        worker_id = int(multiprocessing.current_process().name.rsplit("-", 1)[-1]) - 1
+        cpus = sorted(os.sched_getaffinity(0))
+        start = (worker_id * cpus_per_worker) % len(cpus)
+        mine = {cpus[(start + i) % len(cpus)] for i in range(min(cpus_per_worker, len(cpus)))}
+        os.sched_setaffinity(0, mine)
+        LOG.debug("Pinned worker %d to CPUs %s", worker_id, sorted(mine))
+    except (ValueError, OSError) as e:
+        LOG.debug("CPU pinning skipped: %s", e)
+
+
+def _init_worker(
+    verbose: bool,
+    gs_path: Optional[str],
+    qpdf_path: Optional[str],
+    pin_cpus: int,
+) -> None:
+    # Workers may be spawned rather than forked (macOS default), so module
+    # state from main() is not inherited; hand it over once per worker.
+    global GS_PATH, QPDF_PATH
+    GS_PATH = gs_path
+    QPDF_PATH = qpdf_path
+    setup_logging(verbose)
+    if pin_cpus:
+        pin_worker(pin_cpus)
+
+
+def default_jobs() -> int:
+    return min(os.cpu_count() or 1, 4)
 
 
 def setup_logging(verbose: bool) -> None:
@@ -283,32 +701,103 @@ def setup_logging(verbose: bool) -> None:
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(
         prog="pdfcompress",
-        description="Offline PDF compressor for macOS (Ghostscript preferred, pikepdf fallback).",
+        description="Offline PDF compressor for macOS (Ghostscript preferred, qpdf then pikepdf fallback).",
     )
     src_group = p.add_mutually_exclusive_group(required=True)
     src_group.add_argument("--file", type=str, help="Path to a single PDF file")
     src_group.add_argument("--folder", type=str, help="Path to a folder containing PDFs")
 
     p.add_argument("--out", type=str, required=True, help="Output folder")
-    p.add_argument("--quality", type=str, choices=list(QUALITY_MAP.keys()), default="ebook",
+    p.add_argument("--quality", type=str, choices=QUALITY_CHOICES, default="ebook",
                    help="Compression quality (Ghostscript): screen|ebook|printer|prepress")
     p.add_argument("--overwrite", action="store_true", help="Overwrite existing output files")
     p.add_argument("--recursive", action="store_true", help="Recursively scan subfolders (only with --folder)")
     p.add_argument("--dry-run", action="store_true", help="Show what would happen without writing files")
+    p.add_argument("--jobs", type=int, default=default_jobs(),
+                   help="Number of PDFs to compress in parallel (only with --folder)")
+    p.add_argument("--recompress-flate", action="store_true",
+                   help="qpdf/pikepdf fallback: re-deflate streams at maximum compression (slower, smaller)")
+    p.add_argument("--gs-threads", type=int, default=None,
+                   help="Ghostscript rendering threads per file (default: CPUs divided by --jobs)")
+    p.add_argument("--skip-optimized", action="store_true",
+                   help="Skip PDFs that look already optimized (Ghostscript output or under ~20 KB/page) "
+                        "without running Ghostscript")
+    p.add_argument("--pin-cpus", action="store_true",
+                   help="Linux: pin each parallel worker to its own CPUs (--gs-threads per worker)")
     p.add_argument("--verbose", action="store_true", help="Verbose logging")
-    return p.parse_args()
+    args = p.parse_args()
+    if args.jobs < 1:
+        p.error("--jobs must be at least 1")
+    if args.gs_threads is not None and args.gs_threads < 1:
+        p.error("--gs-threads must be at least 1")
+    return args
+
+
+def iter_results(
+    tasks: list[CompressTask],
+    jobs: int,
+    verbose: bool,
+    prefetch: bool = True,
+    pin_cpus: int = 0,
+) -> Iterator[CompressResult]:
+    """
+    Yield results as they finish. With jobs == 1 the tasks run serially in this
+    process to avoid Pool start-up overhead for small batches.
+
+    With prefetch enabled, the next `jobs` inputs waiting behind the running
+    ones are read ahead into the page cache.
+    """
+    window = 2 * jobs
+    next_prefetch = jobs  # the first `jobs` files start right away
+
+    def advance(done: int) -> None:
+        nonlocal next_prefetch
+        while prefetch and next_prefetch < min(done + window, len(tasks)):
+            prefetch_file(tasks[next_prefetch].src)
+            next_prefetch += 1
+
+    if jobs == 1:
+        for done, task in enumerate(tasks):
+            advance(done)
+            yield _compress_star(task)
+        return
+
+    with multiprocessing.Pool(
+        processes=jobs,
+        initializer=_init_worker,
+        initargs=(verbose, GS_PATH, QPDF_PATH, pin_cpus),
+    ) as pool:
+        results = pool.imap_unordered(_compress_star, tasks, chunksize=1)
+        advance(0)
+        for done, res in enumerate(results, start=1):
+            advance(done)
+            yield res
 
 
 def main() -> int:
+    global GS_PATH, QPDF_PATH
+
     args = parse_args()
     setup_logging(args.verbose)
+    GS_PATH = shutil.which("gs")
+    QPDF_PATH = shutil.which("qpdf")
+    pdfsettings = QUALITY_MAP[args.quality]  # argparse already validated the choice
+    # Manifest entries are only trusted if made with these settings and with gs
+    # equally (un)available; --overwrite ignores them so a recompress can always be forced.
+    manifest_settings = {
+        "quality": args.quality,
+        "recompress_flate": args.recompress_flate,
+        "gs_available": GS_PATH is not None,
+    }
 
     out_dir = Path(args.out).expanduser().resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
 
     if args.file:
         src = Path(args.file).expanduser().resolve()
-        if not src.exists():
+        try:
+            before = os.stat(src).st_size
+        except FileNotFoundError:
             LOG.error("File not found: %s", src)
             return 2
         if src.suffix.lower() != ".pdf":
@@ -316,9 +805,29 @@ def main() -> int:
             return 2
 
         dst = ensure_output_path(src, None, out_dir)
-        res = compress_one(src, dst, args.quality, args.overwrite, args.dry_run)
+        manifest = load_manifest(out_dir)
+        # Scratch dir lives on the output filesystem so the final move is a rename
+        with tempfile.TemporaryDirectory(prefix=".pdfcompress_", dir=out_dir) as td:
+            res = compress_one(
+                src,
+                dst,
+                before,
+                pdfsettings,
+                args.overwrite,
+                args.dry_run,
+                Path(td),
+                args.recompress_flate,
+                args.gs_threads or default_gs_threads(1),
+                None if args.overwrite else manifest_digest(manifest, src, manifest_settings),
+                args.skip_optimized,
+                GS_PATH,
+                QPDF_PATH,
+            )
         print_result(res)
-        return 0 if (not res.skipped) else 1
+        if not args.dry_run and not res.skipped:
+            record_result(manifest, res, manifest_settings)
+            save_manifest(out_dir, manifest)
+        return 0 if (not res.skipped or res.method == "unchanged") else 1
 
     # Folder mode
     folder = Path(args.folder).expanduser().resolve()
@@ -326,7 +835,14 @@ def main() -> int:
         LOG.error("Folder not found or not a directory: %s", folder)
         return 2
 
-    pdfs = sorted(find_pdfs_in_folder(folder, args.recursive))
+    # Sizes are taken once here; they are reused as each file's before-size and
+    # for dispatch order. Files that vanish after the scan are skipped.
+    pdfs: list[Tuple[Path, int]] = []
+    for src in sorted(find_pdfs_in_folder(folder, args.recursive)):
+        try:
+            pdfs.append((src, os.stat(src).st_size))
+        except OSError as e:
+            LOG.warning("Skipping %s: %s", src, e)
     if not pdfs:
         LOG.warning("No PDF files found in: %s", folder)
         return 0
@@ -337,21 +853,61 @@ def main() -> int:
     skipped_files = 0
     failed_files = 0
 
-    for src in pdfs:
-        dst = ensure_output_path(src, folder, out_dir)
-        res = compress_one(src, dst, args.quality, args.overwrite, args.dry_run)
-        print_result(res)
+    gs_threads = args.gs_threads or default_gs_threads(min(args.jobs, len(pdfs)))
+    manifest = load_manifest(out_dir)
 
-        total_before += res.before_bytes
-        if not res.skipped and not args.dry_run:
-            total_after += res.after_bytes
-            saved_files += 1
-        else:
-            # For dry-run, keep totals simple (no writes)
-            if res.method == "failed":
-                failed_files += 1
-            else:
-                skipped_files += 1
+    with tempfile.TemporaryDirectory(prefix=".pdfcompress_", dir=out_dir) as td:
+        scratch_dir = Path(td)
+        tasks = [
+            CompressTask(
+                src=src,
+                dst=ensure_output_path(src, folder, out_dir),
+                before=before,
+                pdfsettings=pdfsettings,
+                overwrite=args.overwrite,
+                dry_run=args.dry_run,
+                scratch_dir=scratch_dir,
+                recompress_flate=args.recompress_flate,
+                gs_threads=gs_threads,
+                known_digest=None if args.overwrite else manifest_digest(manifest, src, manifest_settings),
+                skip_optimized=args.skip_optimized,
+            )
+            for src, before in pdfs
+        ]
+        if not args.dry_run:
+            for d in {task.dst.parent for task in tasks}:
+                d.mkdir(parents=True, exist_ok=True)
+
+        jobs = min(args.jobs, len(tasks))
+        tasks = order_tasks(tasks, jobs)
+
+        try:
+            results = iter_results(
+                tasks,
+                jobs,
+                args.verbose,
+                prefetch=not args.dry_run,
+                pin_cpus=gs_threads if args.pin_cpus else 0,
+            )
+            for n, res in enumerate(results, start=1):
+                print_result(res, flush=(n % PRINT_FLUSH_EVERY == 0))
+                record_result(manifest, res, manifest_settings)
+
+                total_before += res.before_bytes
+                if not res.skipped and not args.dry_run:
+                    total_after += res.after_bytes
+                    saved_files += 1
+                else:
+                    # For dry-run, keep totals simple (no writes)
+                    if res.method == "failed":
+                        failed_files += 1
+                    else:
+                        skipped_files += 1
+            sys.stdout.flush()
+        finally:
+            # Saved even on interrupt so a re-run resumes where this one stopped
+            if not args.dry_run:
+                save_manifest(out_dir, manifest)
 
     if args.dry_run:
         LOG.info("Dry run complete. Files scanned: %d", len(pdfs))
@@ -377,15 +933,20 @@ def main() -> int:
     return 0
 
 
-def print_result(res: CompressResult) -> None:
+def print_result(res: CompressResult, flush: bool = True) -> None:
+    # One write per file (status line + message); results are only ever
+    # printed by the main process, never by Pool workers.
     status = "SKIP" if res.skipped else "OK"
-    print(
+    line = (
         f"[{status}] {res.src.name} -> {res.dst.name} | "
         f"{res.method} | {human_bytes(res.before_bytes)} -> {human_bytes(res.after_bytes)} | "
-        f"saved: {human_bytes(res.saved_bytes)} ({res.saved_pct:.2f}%)"
+        f"saved: {human_bytes(res.saved_bytes)} ({res.saved_pct:.2f}%)\n"
     )
     if res.message:
-        LOG.info("%s: %s", res.src.name, res.message)
+        line += f"    {res.message}\n"
+    sys.stdout.write(line)
+    if flush:
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":